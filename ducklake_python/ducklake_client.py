@@ -4,13 +4,157 @@ DuckLake Python Client
 A client for reading from DuckLake tables using SQLAlchemy and PyArrow.
 """
 
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Hashable, Tuple, ContextManager, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
+from threading import Lock
+import numpy as np
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
+from pyarrow.fs import LocalFileSystem
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+
+
+# Upper bound on the number of data files read concurrently by a single read
+_MAX_READ_WORKERS = 16
+
+# Connection pool defaults for the catalog engine: connections are checked for liveness
+# before use and recycled before managed Postgres instances drop idle ones. Pool sizing
+# is left to SQLAlchemy, since a read checks out a single catalog connection. Both
+# options are understood by every pool class, so any poolclass can be passed in.
+_ENGINE_DEFAULTS: Dict[str, Any] = {
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# Number of rows decoded per record batch when streaming a data file
+_READ_BATCH_SIZE = 64_000
+
+# Maximum number of entries kept by the client's footer and empty-table schema caches
+_META_CACHE_SIZE = 1024
+_SCHEMA_CACHE_SIZE = 128
+
+# Fraction of deleted rows above which a batch is compacted with take() on the kept
+# row indices instead of filter() on a selection mask
+_DENSE_DELETE_RATIO = 0.3
+
+# Catalog queries are built once at import time so every call reuses the same
+# statement objects (and SQLAlchemy's compiled-statement cache entries)
+_CURRENT_SNAPSHOT_SQL = text("""
+    SELECT snapshot_id
+    FROM ducklake_snapshot
+    WHERE snapshot_id = (SELECT max(snapshot_id) FROM ducklake_snapshot)
+""")
+
+_LIST_SCHEMAS_SQL = text("""
+    SELECT schema_id, schema_name
+    FROM ducklake_schema
+    WHERE
+        :snapshot_id >= begin_snapshot AND
+        (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
+""")
+
+_LIST_TABLES_SQL = text("""
+    SELECT table_id, table_name
+    FROM ducklake_table
+    WHERE
+        schema_id = :schema_id AND
+        :snapshot_id >= begin_snapshot AND
+        (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
+""")
+
+_TABLE_COLUMNS_SQL = text("""
+    SELECT column_id, column_name, column_type, column_order
+    FROM ducklake_column
+    WHERE
+        table_id = :table_id AND
+        parent_column IS NULL AND
+        :snapshot_id >= begin_snapshot AND
+        (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
+    ORDER BY column_order
+""")
+
+_DATA_FILES_SQL = text("""
+    SELECT 
+        data.path AS data_file_path,
+        data.path_is_relative AS data_is_relative,
+        del.path AS delete_file_path
+    FROM ducklake_data_file AS data
+    LEFT JOIN (
+        SELECT data_file_id, path
+        FROM ducklake_delete_file
+        WHERE
+            :snapshot_id >= begin_snapshot AND
+            (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
+    ) AS del
+    ON data.data_file_id = del.data_file_id
+    WHERE
+        data.table_id = :table_id AND
+        :snapshot_id >= data.begin_snapshot AND
+        (:snapshot_id < data.end_snapshot OR data.end_snapshot IS NULL)
+    ORDER BY data.file_order
+""")
+
+# Every CTE is left-joined onto the snapshot row, so the result always has at least
+# one row and a missing schema/table shows up as a NULL id
+_RESOLVE_TABLE_FILES_SQL = text("""
+    WITH snap AS (
+        SELECT COALESCE(CAST(:snapshot_id AS BIGINT), max(snapshot_id)) AS snapshot_id
+        FROM ducklake_snapshot
+    ),
+    sch AS (
+        SELECT s.schema_id
+        FROM ducklake_schema AS s, snap
+        WHERE
+            s.schema_name = :schema_name AND
+            snap.snapshot_id >= s.begin_snapshot AND
+            (snap.snapshot_id < s.end_snapshot OR s.end_snapshot IS NULL)
+    ),
+    tab AS (
+        SELECT t.table_id
+        FROM ducklake_table AS t, sch, snap
+        WHERE
+            t.schema_id = sch.schema_id AND
+            t.table_name = :table_name AND
+            snap.snapshot_id >= t.begin_snapshot AND
+            (snap.snapshot_id < t.end_snapshot OR t.end_snapshot IS NULL)
+    ),
+    files AS (
+        SELECT
+            data.table_id,
+            data.file_order,
+            data.path AS data_file_path,
+            data.path_is_relative AS data_is_relative,
+            del.path AS delete_file_path
+        FROM ducklake_data_file AS data
+        CROSS JOIN snap
+        LEFT JOIN ducklake_delete_file AS del
+        ON
+            data.data_file_id = del.data_file_id AND
+            snap.snapshot_id >= del.begin_snapshot AND
+            (snap.snapshot_id < del.end_snapshot OR del.end_snapshot IS NULL)
+        WHERE
+            snap.snapshot_id >= data.begin_snapshot AND
+            (snap.snapshot_id < data.end_snapshot OR data.end_snapshot IS NULL)
+    )
+    SELECT
+        snap.snapshot_id,
+        sch.schema_id,
+        tab.table_id,
+        files.data_file_path,
+        files.data_is_relative,
+        files.delete_file_path
+    FROM snap
+    LEFT JOIN sch ON TRUE
+    LEFT JOIN tab ON TRUE
+    LEFT JOIN files ON files.table_id = tab.table_id
+    ORDER BY files.file_order
+""")
 
 
 @dataclass
@@ -23,11 +167,101 @@ class TableColumn:
 
 
 @dataclass
-class DataFile:
-    """Represents a data file with optional delete file."""
-    data_file_path: str
-    delete_file_path: Optional[str]
-    path_is_relative: bool
+class DataFileBatch:
+    """Represents the data files of a table (with optional delete files), stored column-wise."""
+    data_file_paths: List[str] = field(default_factory=list)
+    path_is_relative: List[bool] = field(default_factory=list)
+    delete_file_paths: List[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.data_file_paths)
+
+    def append(self, data_file_path: str, path_is_relative: bool, delete_file_path: Optional[str]) -> None:
+        """Add a data file to the batch."""
+        self.data_file_paths.append(data_file_path)
+        self.path_is_relative.append(path_is_relative)
+        self.delete_file_paths.append(delete_file_path)
+
+
+class _LRUCache:
+    """Thread-safe mapping that evicts its least recently used entries beyond maxsize."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _load_fragment(
+    parquet_format: ds.ParquetFileFormat, filesystem: LocalFileSystem, path: str
+) -> ds.ParquetFileFragment:
+    """Create a fragment for a Parquet file and parse its footer into it."""
+    fragment = parquet_format.make_fragment(path, filesystem)
+    fragment.ensure_complete_metadata()
+    return fragment
+
+
+def _project_schema(schema: pa.Schema, columns: Optional[List[str]] = None) -> pa.Schema:
+    """Project a schema onto the requested columns, in the requested order."""
+    if columns is None:
+        return schema
+    missing = [name for name in columns if schema.get_field_index(name) == -1]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in table")
+    return pa.schema([schema.field(name) for name in columns])
+
+
+def _filter_deleted_rows(
+    table: Union[pa.Table, pa.RecordBatch],
+    delete_row_ids: np.ndarray,
+    keep_mask: Optional[np.ndarray] = None
+) -> Union[pa.Table, pa.RecordBatch]:
+    """
+    Drop the rows at the given positions (relative to the start of the table/batch).
+    
+    keep_mask is an optional scratch buffer of at least len(table) booleans, so callers
+    filtering many batches can reuse one selection vector instead of allocating one per batch.
+    """
+    if delete_row_ids.size == 0:
+        return table
+    if keep_mask is None or len(keep_mask) < len(table):
+        keep_mask = np.empty(len(table), dtype=bool)
+    keep_mask = keep_mask[:len(table)]
+    # Scatter the deleted positions into a selection vector (pa.array copies the mask,
+    # so the buffer can be reused right away)
+    keep_mask.fill(True)
+    keep_mask[delete_row_ids] = False
+    if delete_row_ids.size > _DENSE_DELETE_RATIO * len(table):
+        # Dense deletes: gathering the surviving rows beats a filter over a mask
+        # with many scattered holes
+        return table.take(pa.array(np.flatnonzero(keep_mask)))
+    return table.filter(pa.array(keep_mask))
 
 
 class DucklakeClient:
@@ -37,16 +271,32 @@ class DucklakeClient:
     # and will potentially mess up with schema evolution. Also empty tables cannot have types since
     # there are no parquet files to infer from.
     
-    def __init__(self, connection_string: str, data_path: Optional[str] = None):
+    def __init__(
+        self,
+        connection_string: str,
+        data_path: Optional[str] = None,
+        engine_kwargs: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize DuckLake client.
         
         Args:
             connection_string: SQLAlchemy connection string for the catalog database
             data_path: Base path for data files (used for relative paths)
+            engine_kwargs: Extra create_engine arguments (e.g. poolclass, pool_size), taking
+                precedence over the pool defaults
         """
-        self.engine: Engine = create_engine(connection_string)
+        self.engine: Engine = create_engine(connection_string, **{**_ENGINE_DEFAULTS, **(engine_kwargs or {})})
         self.data_path = Path(data_path) if data_path else None
+        self._snapshot_id: Optional[int] = None
+        # Parquet fragments (with their parsed footers) keyed by file path. DuckLake never
+        # rewrites a file in place, so a footer stays valid for as long as its path is
+        # referenced; files retired by compaction simply age out of the LRU.
+        self._meta_cache = _LRUCache(_META_CACHE_SIZE)
+        self._parquet_format = ds.ParquetFileFormat()
+        self._filesystem = LocalFileSystem()
+        # Schemas of tables without data files keyed by (table_id, snapshot_id)
+        self._schema_cache = _LRUCache(_SCHEMA_CACHE_SIZE)
         self._closed = False
     
     def close(self) -> None:
@@ -56,6 +306,8 @@ class DucklakeClient:
         try:
             # Dispose of SQLAlchemy Engine to close pooled DBAPI connections
             self.engine.dispose()
+            self._meta_cache.clear()
+            self._schema_cache.clear()
         finally:
             self._closed = True
 
@@ -67,105 +319,101 @@ class DucklakeClient:
     def __exit__(self, exc_type, exc, tb):
         self.close()
 
-    def get_current_snapshot_id(self) -> int:
-        """Get the most recent snapshot ID."""
-        query = text("""
-            SELECT snapshot_id
-            FROM ducklake_snapshot
-            WHERE snapshot_id = (SELECT max(snapshot_id) FROM ducklake_snapshot)
-        """)
+    def _connect(self, conn: Optional[Connection] = None) -> ContextManager[Connection]:
+        """Reuse an open catalog connection, or check a new one out of the pool."""
+        return nullcontext(conn) if conn is not None else self.engine.connect()
+
+    def refresh(self) -> None:
+        """Unpin the snapshot used by read_table so the next read picks up the latest one."""
+        self._snapshot_id = None
+
+    def get_current_snapshot_id(self, conn: Optional[Connection] = None) -> int:
+        """
+        Get the most recent snapshot ID.
         
-        with self.engine.connect() as conn:
-            result = conn.execute(query).fetchone()
+        Args:
+            conn: Open catalog connection to reuse (checks one out if None)
+        """
+        with self._connect(conn) as conn:
+            result = conn.execute(_CURRENT_SNAPSHOT_SQL).fetchone()
             if result is None:
                 raise ValueError("No snapshots found in the catalog")
             return result[0]
     
-    def list_schemas(self, snapshot_id: Optional[int] = None) -> List[Tuple[int, str]]:
+    def list_schemas(
+        self,
+        snapshot_id: Optional[int] = None,
+        conn: Optional[Connection] = None
+    ) -> List[Tuple[int, str]]:
         """
         List all schemas available at a given snapshot.
         
         Args:
             snapshot_id: Snapshot ID to query (uses current if None)
+            conn: Open catalog connection to reuse (checks one out if None)
             
         Returns:
             List of (schema_id, schema_name) tuples
         """
         if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
+            snapshot_id = self.get_current_snapshot_id(conn)
         
-        query = text("""
-            SELECT schema_id, schema_name
-            FROM ducklake_schema
-            WHERE
-                :snapshot_id >= begin_snapshot AND
-                (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
-        """)
-        
-        with self.engine.connect() as conn:
-            results = conn.execute(query, {"snapshot_id": snapshot_id}).fetchall()
+        with self._connect(conn) as conn:
+            results = conn.execute(_LIST_SCHEMAS_SQL, {"snapshot_id": snapshot_id})
             return [(row[0], row[1]) for row in results]
     
-    def list_tables(self, schema_id: int, snapshot_id: Optional[int] = None) -> List[Tuple[int, str]]:
+    def list_tables(
+        self,
+        schema_id: int,
+        snapshot_id: Optional[int] = None,
+        conn: Optional[Connection] = None
+    ) -> List[Tuple[int, str]]:
         """
         List all tables in a schema at a given snapshot.
         
         Args:
             schema_id: Schema ID to query
             snapshot_id: Snapshot ID to query (uses current if None)
+            conn: Open catalog connection to reuse (checks one out if None)
             
         Returns:
             List of (table_id, table_name) tuples
         """
         if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
+            snapshot_id = self.get_current_snapshot_id(conn)
         
-        query = text("""
-            SELECT table_id, table_name
-            FROM ducklake_table
-            WHERE
-                schema_id = :schema_id AND
-                :snapshot_id >= begin_snapshot AND
-                (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
-        """)
-        
-        with self.engine.connect() as conn:
+        with self._connect(conn) as conn:
             results = conn.execute(
-                query, 
+                _LIST_TABLES_SQL, 
                 {"schema_id": schema_id, "snapshot_id": snapshot_id}
-            ).fetchall()
+            )
             return [(row[0], row[1]) for row in results]
     
-    def get_table_columns(self, table_id: int, snapshot_id: Optional[int] = None) -> List[TableColumn]:
+    def get_table_columns(
+        self,
+        table_id: int,
+        snapshot_id: Optional[int] = None,
+        conn: Optional[Connection] = None
+    ) -> List[TableColumn]:
         """
         Get the column structure of a table.
         
         Args:
             table_id: Table ID to query
             snapshot_id: Snapshot ID to query (uses current if None)
+            conn: Open catalog connection to reuse (checks one out if None)
             
         Returns:
             List of TableColumn objects
         """
         if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
-        
-        query = text("""
-            SELECT column_id, column_name, column_type, column_order
-            FROM ducklake_column
-            WHERE
-                table_id = :table_id AND
-                parent_column IS NULL AND
-                :snapshot_id >= begin_snapshot AND
-                (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
-            ORDER BY column_order
-        """)
+            snapshot_id = self.get_current_snapshot_id(conn)
         
-        with self.engine.connect() as conn:
+        with self._connect(conn) as conn:
             results = conn.execute(
-                query,
+                _TABLE_COLUMNS_SQL,
                 {"table_id": table_id, "snapshot_id": snapshot_id}
-            ).fetchall()
+            )
             
             return [
                 TableColumn(
@@ -177,69 +425,173 @@ class DucklakeClient:
                 for row in results
             ]
     
-    def get_data_files(self, table_id: int, snapshot_id: Optional[int] = None) -> List[DataFile]:
+    def get_data_files(
+        self,
+        table_id: int,
+        snapshot_id: Optional[int] = None,
+        conn: Optional[Connection] = None
+    ) -> DataFileBatch:
         """
         Get the list of data files and associated delete files for a table.
         
         Args:
             table_id: Table ID to query
             snapshot_id: Snapshot ID to query (uses current if None)
+            conn: Open catalog connection to reuse (checks one out if None)
             
         Returns:
-            List of DataFile objects
+            DataFileBatch with one entry per data file
         """
         if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
+            snapshot_id = self.get_current_snapshot_id(conn)
         
-        query = text("""
-            SELECT 
-                data.path AS data_file_path,
-                data.path_is_relative AS data_is_relative,
-                del.path AS delete_file_path
-            FROM ducklake_data_file AS data
-            LEFT JOIN (
-                SELECT data_file_id, path
-                FROM ducklake_delete_file
-                WHERE
-                    :snapshot_id >= begin_snapshot AND
-                    (:snapshot_id < end_snapshot OR end_snapshot IS NULL)
-            ) AS del
-            ON data.data_file_id = del.data_file_id
-            WHERE
-                data.table_id = :table_id AND
-                :snapshot_id >= data.begin_snapshot AND
-                (:snapshot_id < data.end_snapshot OR data.end_snapshot IS NULL)
-            ORDER BY data.file_order
-        """)
-        with self.engine.connect() as conn:
+        with self._connect(conn) as conn:
             results = conn.execute(
-                query,
+                _DATA_FILES_SQL,
                 {"table_id": table_id, "snapshot_id": snapshot_id}
-            ).fetchall()
+            )
             
-            return [
-                DataFile(
-                    data_file_path=row[0],
-                    path_is_relative=row[1],
-                    delete_file_path=row[2]
-                )
-                for row in results
-            ]
+            data_files = DataFileBatch()
+            for row in results:
+                data_files.append(row[0], row[1], row[2])
+            return data_files
     
-    def _resolve_path(self, path: str, is_relative: bool, table_name: str, schema_name: str) -> Path:
-        """Resolve a file path (relative or absolute)."""
+    def _resolve_table_files(
+        self,
+        schema_name: str,
+        table_name: str,
+        snapshot_id: Optional[int] = None,
+        conn: Optional[Connection] = None
+    ) -> Tuple[int, int, DataFileBatch]:
+        """
+        Resolve a table by name and fetch its data files in a single catalog round-trip.
+        
+        Args:
+            schema_name: Name of the schema
+            table_name: Name of the table
+            snapshot_id: Snapshot ID to query (uses the pinned snapshot if None)
+            conn: Open catalog connection to reuse (checks one out if None)
+            
+        Returns:
+            Tuple of (snapshot_id, table_id, data files)
+        """
+        requested_snapshot_id = snapshot_id
+        if snapshot_id is None:
+            # May still be None, in which case the query resolves the latest snapshot
+            snapshot_id = self._snapshot_id
+        
+        with self._connect(conn) as conn:
+            results = conn.execute(
+                _RESOLVE_TABLE_FILES_SQL,
+                {"snapshot_id": snapshot_id, "schema_name": schema_name, "table_name": table_name}
+            )
+            
+            first = results.fetchone()
+            snapshot_id, schema_id, table_id = first[0], first[1], first[2]
+            if snapshot_id is None:
+                raise ValueError("No snapshots found in the catalog")
+            if schema_id is None:
+                raise ValueError(f"Schema '{schema_name}' not found")
+            if table_id is None:
+                raise ValueError(f"Table '{table_name}' not found in schema '{schema_name}'")
+            if requested_snapshot_id is None:
+                self._snapshot_id = snapshot_id
+            
+            data_files = DataFileBatch()
+            # An empty table comes back as a single row without a data file
+            if first[3] is not None:
+                data_files.append(first[3], first[4], first[5])
+                for row in results:
+                    data_files.append(row[3], row[4], row[5])
+        
+        return snapshot_id, table_id, data_files
+    
+    def _table_data_path(self, table_name: str, schema_name: str) -> Optional[Path]:
+        """Absolute directory that relative file paths of a table are resolved against."""
+        if self.data_path is None:
+            return None
+        return (self.data_path / schema_name / table_name).absolute()
+
+    def _resolve_path(self, path: str, is_relative: bool, table_data_path: Optional[Path]) -> Path:
+        """Resolve a file path (relative or absolute) against a table's data path."""
         if is_relative:
-            if self.data_path is None:
+            if table_data_path is None:
                 raise ValueError("Relative path provided but no data_path configured")
-            return (self.data_path / schema_name /table_name / path).absolute()
-        return Path(path).absolute()
+            return table_data_path / path
+        return Path(path)
     
-    def _read_delete_row_ids(self, delete_file_path: Path) -> List[int]:
+    def _open_pq(self, path: Path) -> pq.ParquetFile:
+        """
+        Open a Parquet file, reusing its footer if it was parsed before.
+        
+        The caller owns the returned file and should use it as a context manager.
+        """
+        return pq.ParquetFile(str(path), metadata=self._fragment(path).metadata)
+
+    def _fragment(self, path: Path) -> ds.ParquetFileFragment:
+        """Fragment of a Parquet file with its footer, from the metadata cache or read from the file."""
+        key = str(path)
+        fragment = self._meta_cache.get(key)
+        if fragment is None:
+            fragment = _load_fragment(self._parquet_format, self._filesystem, key)
+            self._meta_cache.put(key, fragment)
+        return fragment
+
+    def _prefetch_metadata(
+        self, executor: ThreadPoolExecutor, paths: List[Path]
+    ) -> List[ds.ParquetFileFragment]:
+        """Fetch the footers of files missing from the metadata cache concurrently."""
+        return list(executor.map(self._fragment, paths))
+
+    def _read_data_file(
+        self,
+        data_path: Path,
+        columns: Optional[List[str]] = None,
+        delete_row_ids: Optional[np.ndarray] = None
+    ) -> pa.Table:
+        """
+        Read a data file by streaming its record batches (already does projection pushdown).
+        
+        Args:
+            data_path: Path of the data file
+            columns: Optional list of column names to read (reads all if None)
+            delete_row_ids: Optional positions of deleted rows, dropped batch by batch
+            
+        Returns:
+            PyArrow Table containing the live rows of the file
+        """
+        # Filter out deleted rows (by position)
+        # This feels super flaky and it is based on the assumption that order is kept
+        deletes = np.sort(delete_row_ids) if delete_row_ids is not None else np.empty(0, dtype=np.int64)
+        
+        batches = []
+        keep_mask = np.empty(_READ_BATCH_SIZE, dtype=bool) if deletes.size else None
+        row_offset = 0
+        start = 0
+        with self._open_pq(data_path) as pf:
+            schema = _project_schema(pf.schema_arrow, columns)
+            # Threads are spent across files by the read pool rather than within a single file
+            for batch in pf.iter_batches(batch_size=_READ_BATCH_SIZE, columns=columns, use_threads=False):
+                num_rows = batch.num_rows
+                # deletes[start:end] are the positions that fall inside this batch; batches
+                # without any are passed through untouched
+                end = int(np.searchsorted(deletes, row_offset + num_rows))
+                if end > start:
+                    batch = _filter_deleted_rows(batch, deletes[start:end] - row_offset, keep_mask)
+                batches.append(batch)
+                row_offset += num_rows
+                start = end
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def _read_delete_row_ids(self, delete_file_path: Path) -> np.ndarray:
         """Read positions to delete from a delete file."""
-        table = pq.read_table(str(delete_file_path))
+        with self._open_pq(delete_file_path) as pf:
+            table = pf.read(columns=["pos"])
         # Delete files contain row indices to be removed
         # Assuming the column is named 'row_id' or similar
-        return table['pos'].to_pylist()
+        # Hand out a view of the int64 buffer rather than converting positions into
+        # Python objects (delete positions are never null)
+        return table['pos'].combine_chunks().to_numpy(zero_copy_only=True)
 
     def _read_table(
         self, 
@@ -247,7 +599,9 @@ class DucklakeClient:
         table_name: str,
         schema_name: str,
         snapshot_id: Optional[int] = None,
-        columns: Optional[List[str]] = None
+        columns: Optional[List[str]] = None,
+        data_files: Optional[DataFileBatch] = None,
+        conn: Optional[Connection] = None
     ) -> pa.Table:
         """
         Read a complete table into memory.
@@ -256,55 +610,101 @@ class DucklakeClient:
             table_id: Table ID to read
             snapshot_id: Snapshot ID to query (uses current if None)
             columns: Optional list of column names to read (reads all if None)
+            data_files: Data files of the table at snapshot_id (fetched if None)
+            conn: Open catalog connection to reuse (checks one out if None)
             
         Returns:
             PyArrow Table containing the data
         """
         if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
+            snapshot_id = self.get_current_snapshot_id(conn)
         
         # Get data files
-        data_files = self.get_data_files(table_id, snapshot_id)
+        if data_files is None:
+            data_files = self.get_data_files(table_id, snapshot_id, conn)
         
         if not data_files:
-            # Return empty table with schema
-            if columns:
-                table_columns = [c for c in table_columns if c.column_name in columns]
-            else:
-                table_columns = self.get_table_columns(table_id, snapshot_id)
-            
-            # Create empty schema 
-            # TODO: Map DuckLake types to PyArrow types properly. This is pretty bad.
-            schema = pa.schema([
-                pa.field(col.column_name, pa.string())  # Simplified type handling
-                for col in table_columns
-            ])
-            return pa.Table.from_pydict({f.name: [] for f in schema}, schema=schema)
+            # Return empty table with schema. A table's files (and columns) are fixed at a
+            # given snapshot, so the schema is only looked up once per snapshot.
+            schema = self._schema_cache.get((table_id, snapshot_id))
+            if schema is None:
+                table_columns = self.get_table_columns(table_id, snapshot_id, conn)
+                # Create empty schema 
+                # TODO: Map DuckLake types to PyArrow types properly. This is pretty bad.
+                schema = pa.schema([
+                    pa.field(col.column_name, pa.string())  # Simplified type handling
+                    for col in table_columns
+                ])
+                self._schema_cache.put((table_id, snapshot_id), schema)
+            return _project_schema(schema, columns).empty_table()
         
-        # Read all data files
-        arrow_tables = []
-        for df in data_files:
-            data_path = self._resolve_path(df.data_file_path, df.path_is_relative, table_name, schema_name)
-            # Read the data file (already does projection pushdown)
-            table = pq.read_table(str(data_path), columns=columns)
-            
+        # Resolve (data file, delete file) paths up front
+        # The table directory is resolved once, so the loop only joins file names onto it
+        table_data_path = self._table_data_path(table_name, schema_name)
+        file_paths = []
+        for i in range(len(data_files)):
+            is_relative = data_files.path_is_relative[i]
+            delete_file_path = data_files.delete_file_paths[i]
+            file_paths.append((
+                self._resolve_path(data_files.data_file_paths[i], is_relative, table_data_path),
+                self._resolve_path(delete_file_path, is_relative, table_data_path)
+                if delete_file_path else None
+            ))
+        
+        def _read_one(paths: Tuple[Path, Optional[Path]]) -> pa.Table:
+            data_path, delete_path = paths
             # Apply delete file if present
-            if df.delete_file_path:
-                delete_path = self._resolve_path(df.delete_file_path, df.path_is_relative, table_name, schema_name)
-                delete_row_ids = self._read_delete_row_ids(delete_path)
-                
-                # Filter out deleted rows (by position)
-                # This feels super flaky and it is based on the assumption that order is kept
-                row_indices = list(range(len(table)))
-                keep_mask = [i not in delete_row_ids for i in row_indices]
-                table = table.filter(pa.array(keep_mask))
+            delete_row_ids = self._read_delete_row_ids(delete_path) if delete_path is not None else None
+            return self._read_data_file(data_path, columns, delete_row_ids)
+        
+        # Files with a delete file are read one by one on the pool; all other files are
+        # scanned together as one dataset, which Arrow schedules on its own thread pool
+        delete_indices = [i for i, (_, delete_path) in enumerate(file_paths) if delete_path is not None]
+        scan_indices = [i for i, (_, delete_path) in enumerate(file_paths) if delete_path is None]
+        
+        arrow_tables: List[Optional[pa.Table]] = [None] * len(file_paths)
+        with ThreadPoolExecutor(max_workers=min(len(data_files), _MAX_READ_WORKERS)) as ex:
+            # Fetch all uncached footers in one concurrent pass, so each read below
+            # starts straight at the data pages
+            data_fragments = self._prefetch_metadata(
+                ex, [data_path for data_path, _ in file_paths] + [file_paths[i][1] for i in delete_indices]
+            )[:len(file_paths)]
+            file_schemas = [fragment.physical_schema for fragment in data_fragments]
+            fragments = [data_fragments[i] for i in scan_indices]
+            
+            # Every file must provide the same (projected) schema, whichever way it is read
+            schema = _project_schema(file_schemas[0], columns)
+            for i in range(1, len(file_paths)):
+                if not _project_schema(file_schemas[i], columns).equals(schema):
+                    raise ValueError(
+                        f"Data file '{file_paths[i][0]}' does not match the schema of "
+                        f"'{file_paths[0][0]}'"
+                    )
+            
+            # Read files with deletes concurrently, overlapping I/O and decode across files
+            futures = [(i, ex.submit(_read_one, file_paths[i])) for i in delete_indices]
             
-            arrow_tables.append(table)
+            if scan_indices:
+                dataset = ds.FileSystemDataset(fragments, schema, self._parquet_format, self._filesystem)
+                if not delete_indices:
+                    return dataset.to_table(use_threads=True)
+                # Regroup the scanned batches by the fragment they came from, so each file
+                # takes its file_order position among the files read with deletes
+                file_batches: Dict[str, List[pa.RecordBatch]] = {f.path: [] for f in fragments}
+                for tagged in dataset.scanner().scan_batches():
+                    file_batches[tagged.fragment.path].append(tagged.record_batch)
+                for i, fragment in zip(scan_indices, fragments):
+                    arrow_tables[i] = pa.Table.from_batches(file_batches[fragment.path], schema=schema)
+            
+            for i, future in futures:
+                arrow_tables[i] = future.result()
         
         # Concatenate all tables
         if len(arrow_tables) == 1:
             return arrow_tables[0]
-        return pa.concat_tables(arrow_tables)
+        # Schemas were checked above, so the concat only splices chunks together without
+        # promoting or copying buffers
+        return pa.concat_tables(arrow_tables, promote_options="none")
     
     def read_table(
         self,
@@ -316,40 +716,31 @@ class DucklakeClient:
         """
         Read a table by schema and table name.
         
+        When snapshot_id is None, the first read pins the client to the snapshot that is
+        current at that moment and later reads reuse it (no extra catalog round-trip, and
+        consecutive reads are consistent). Call refresh() to move to the latest snapshot.
+        
         Args:
             schema_name: Name of the schema
             table_name: Name of the table
-            snapshot_id: Snapshot ID to query (uses current if None)
+            snapshot_id: Snapshot ID to query (uses the pinned snapshot if None)
             columns: Optional list of column names to read
             
         Returns:
             PyArrow Table containing the data
         """
-        if snapshot_id is None:
-            snapshot_id = self.get_current_snapshot_id()
-        
-        # Find schema
-        schemas = self.list_schemas(snapshot_id)
-        schema_id = None
-        for sid, sname in schemas:
-            if sname == schema_name:
-                schema_id = sid
-                break
-        
-        if schema_id is None:
-            raise ValueError(f"Schema '{schema_name}' not found")
-        
-        # Find table
-        tables = self.list_tables(schema_id, snapshot_id)
-        table_id = None
-        for tid, tname in tables:
-            if tname == table_name:
-                table_id = tid
-                break
-        
-        if table_id is None:
-            raise ValueError(f"Table '{table_name}' not found in schema '{schema_name}'")
+        # All catalog lookups share one connection and run as a single transaction
+        with self.engine.connect() as conn, conn.begin():
+            snapshot_id, table_id, data_files = self._resolve_table_files(
+                schema_name, table_name, snapshot_id, conn
+            )
+            if not data_files:
+                # Empty tables need one more catalog lookup to describe their columns
+                return self._read_table(
+                    table_id, table_name, schema_name, snapshot_id, columns, data_files, conn
+                )
         
-        return self._read_table(table_id, table_name, schema_name, snapshot_id, columns)
+        # The catalog connection is returned to the pool before any data file is read
+        return self._read_table(table_id, table_name, schema_name, snapshot_id, columns, data_files)
 
     
\ No newline at end of file
@@ -13,7 +13,10 @@ from pathlib import Path
 import tempfile
 import shutil
 from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
 from ducklake_python import DucklakeClient
+import ducklake_python.ducklake_client as ducklake_client_module
+from ducklake_python.ducklake_client import _DENSE_DELETE_RATIO, _READ_BATCH_SIZE, _LRUCache
 
 
 @pytest.fixture(scope="session")
@@ -249,6 +252,45 @@ def test_column_selection(duckdb_conn, ducklake_client):
 #     assert dc_client_result.num_rows == 0, "Should have 0 rows"
 
 
+def test_empty_table_column_selection(duckdb_conn, ducklake_client, monkeypatch):
+    """Test selecting columns from a table without data files."""
+    # Types are not compared here, see test_empty_table above
+    conn = duckdb_conn
+    
+    conn.execute("CREATE SCHEMA test_schema_empty_cols")
+    conn.execute("""
+        CREATE TABLE test_schema_empty_cols.empty_table (
+            id INTEGER,
+            name VARCHAR,
+            value DOUBLE
+        )
+    """)
+    
+    # Don't insert any data
+    
+    # Read all columns
+    dc_client_result = ducklake_client.read_table("test_schema_empty_cols", "empty_table")
+    assert dc_client_result.column_names == ["id", "name", "value"]
+    assert dc_client_result.num_rows == 0, "Should have 0 rows"
+    
+    # Further reads at the same snapshot are served from the cached schema
+    def _no_catalog_lookup(*args, **kwargs):
+        raise AssertionError("Column metadata should come from the schema cache")
+    monkeypatch.setattr(ducklake_client, "get_table_columns", _no_catalog_lookup)
+    
+    # Columns come back in the requested order, like for tables with data files
+    dc_client_result = ducklake_client.read_table(
+        "test_schema_empty_cols",
+        "empty_table",
+        columns=["value", "id"]
+    )
+    assert dc_client_result.column_names == ["value", "id"]
+    assert dc_client_result.num_rows == 0, "Should have 0 rows"
+    
+    with pytest.raises(ValueError):
+        ducklake_client.read_table("test_schema_empty_cols", "empty_table", columns=["missing"])
+
+
 def test_various_data_types(duckdb_conn, ducklake_client):
     """
     Test reading a table with various data types.
@@ -378,4 +420,186 @@ def test_read_with_delete_files(ducklake_client, duckdb_conn):
     # Sort both tables by id to ensure consistent order
     dc_result_sorted = dc_result.sort_by([("id", "ascending")])
 
-    assert dc_result_sorted.equals(duckdb_result), "Tables should be equal"
\ No newline at end of file
+    assert dc_result_sorted.equals(duckdb_result), "Tables should be equal"
+
+
+def test_read_mixed_delete_files(ducklake_client, duckdb_conn):
+    """Test reading a table where only some of the data files have delete files."""
+    conn = duckdb_conn
+    
+    conn.execute("CREATE SCHEMA test_schema_mixed")
+    conn.execute("""
+        CREATE TABLE test_schema_mixed.mixed_table (
+            id INTEGER,
+            value VARCHAR
+        )
+    """)
+    
+    # Insert data in multiple batches to create multiple files
+    for i in range(3):
+        conn.execute(f"""
+            INSERT INTO test_schema_mixed.mixed_table
+            SELECT range AS id, 'batch_{i}_' || range AS value
+            FROM range({i * 100}, {(i + 1) * 100})
+        """)
+    
+    # Only the middle file gets a delete file
+    conn.execute("DELETE FROM test_schema_mixed.mixed_table WHERE id = 150")
+    
+    # Read with custom client
+    dc_result = ducklake_client.read_table("test_schema_mixed", "mixed_table")
+    
+    # Rows come back in file_order, whichever way each file was read
+    expected_ids = [i for i in range(300) if i != 150]
+    assert dc_result.column("id").to_pylist() == expected_ids, "Rows should follow file_order"
+    
+    # Read with DuckDB
+    duckdb_result = conn.execute("SELECT * FROM test_schema_mixed.mixed_table ORDER BY id").fetch_arrow_table()
+    
+    # Compare
+    dc_result_sorted = dc_result.sort_by([("id", "ascending")])
+    assert dc_result_sorted.equals(duckdb_result), "Tables with mixed delete files should be equal"
+
+
+def test_read_reuses_cached_footers(ducklake_client, duckdb_conn, monkeypatch):
+    """Test that a second read of a table without deletes does not read any footer again."""
+    conn = duckdb_conn
+    
+    conn.execute("CREATE SCHEMA test_schema_footers")
+    conn.execute("CREATE TABLE test_schema_footers.footers_table (id INTEGER)")
+    for i in range(2):
+        conn.execute(f"INSERT INTO test_schema_footers.footers_table SELECT range FROM range({i * 10}, {(i + 1) * 10})")
+    
+    first_result = ducklake_client.read_table("test_schema_footers", "footers_table")
+    assert len(ducklake_client._meta_cache) == 2, "Both data files should be cached"
+    
+    def _no_footer_read(*args, **kwargs):
+        raise AssertionError("Footer should be served from the metadata cache")
+    
+    monkeypatch.setattr(ducklake_client_module, "_load_fragment", _no_footer_read)
+    second_result = ducklake_client.read_table("test_schema_footers", "footers_table")
+    
+    assert second_result.equals(first_result), "Cached reads should return the same data"
+
+
+def test_read_with_deletes_across_batches(ducklake_client, duckdb_conn, monkeypatch):
+    """Test delete files whose positions span several record batches of a data file."""
+    conn = duckdb_conn
+    num_rows = 3 * _READ_BATCH_SIZE
+    dense_start, dense_end = _READ_BATCH_SIZE, 2 * _READ_BATCH_SIZE - 1
+    
+    conn.execute("CREATE SCHEMA test_schema_batch_deletes")
+    conn.execute("""
+        CREATE TABLE test_schema_batch_deletes.batch_deletes_table (
+            id BIGINT,
+            value VARCHAR
+        )
+    """)
+    
+    # A single insert writes a single data file, with rows in id order
+    conn.execute(f"""
+        INSERT INTO test_schema_batch_deletes.batch_deletes_table
+        SELECT range AS id, 'value_' || range AS value
+        FROM range({num_rows})
+    """)
+    
+    # Sparse deletes in every batch, including both sides of each batch boundary,
+    # plus a dense run in the second batch
+    boundaries = [_READ_BATCH_SIZE - 1, _READ_BATCH_SIZE, 2 * _READ_BATCH_SIZE - 1, 2 * _READ_BATCH_SIZE]
+    conn.execute(f"""
+        DELETE FROM test_schema_batch_deletes.batch_deletes_table
+        WHERE
+            id % 1000 = 7 OR
+            id IN ({", ".join(str(b) for b in boundaries)}) OR
+            (id BETWEEN {dense_start} AND {dense_end} AND id % 2 = 1)
+    """)
+    
+    # Record the deletes handed to each batch to see which compaction path it takes
+    filter_deleted_rows = ducklake_client_module._filter_deleted_rows
+    batch_paths = []
+    
+    def _record_path(batch, delete_row_ids, keep_mask=None):
+        dense = delete_row_ids.size > _DENSE_DELETE_RATIO * batch.num_rows
+        batch_paths.append("take" if dense else "filter")
+        return filter_deleted_rows(batch, delete_row_ids, keep_mask)
+    
+    monkeypatch.setattr(ducklake_client_module, "_filter_deleted_rows", _record_path)
+    
+    # Read with our custom client
+    dc_result = ducklake_client.read_table("test_schema_batch_deletes", "batch_deletes_table")
+    
+    # The first and last batches take the sparse (filter) path, the second one the dense (take) path
+    assert batch_paths == ["filter", "take", "filter"], "Each batch should be compacted on its own"
+    deleted = {i for i in range(num_rows) if i % 1000 == 7} | set(boundaries)
+    deleted |= {i for i in range(dense_start, dense_end + 1) if i % 2 == 1}
+    expected_ids = [i for i in range(num_rows) if i not in deleted]
+    assert dc_result.column("id").to_pylist() == expected_ids, "Deleted positions should be dropped"
+    
+    # Read with DuckDB DuckLake client
+    duckdb_result = conn.execute("SELECT * FROM test_schema_batch_deletes.batch_deletes_table ORDER BY id").fetch_arrow_table()
+    
+    # Compare results
+    dc_result_sorted = dc_result.sort_by([("id", "ascending")])
+    assert dc_result_sorted.equals(duckdb_result), "Tables should be equal"
+
+
+def test_refresh_snapshot(ducklake_client, duckdb_conn):
+    """Test that read_table is pinned to its first snapshot until refresh() is called."""
+    conn = duckdb_conn
+    
+    conn.execute("CREATE SCHEMA test_schema_refresh")
+    conn.execute("CREATE TABLE test_schema_refresh.refresh_table (id INTEGER)")
+    conn.execute("INSERT INTO test_schema_refresh.refresh_table VALUES (1), (2)")
+    
+    # First read resolves and caches the current snapshot
+    dc_result = ducklake_client.read_table("test_schema_refresh", "refresh_table")
+    assert dc_result.num_rows == 2
+    
+    # New commits are not visible until the client is refreshed
+    conn.execute("INSERT INTO test_schema_refresh.refresh_table VALUES (3)")
+    dc_result = ducklake_client.read_table("test_schema_refresh", "refresh_table")
+    assert dc_result.num_rows == 2, "Reads should stay on the cached snapshot"
+    
+    # The listing helpers are not pinned and see the latest snapshot
+    conn.execute("CREATE SCHEMA test_schema_refresh_new")
+    schema_names = [name for _, name in ducklake_client.list_schemas()]
+    assert "test_schema_refresh_new" in schema_names
+    
+    ducklake_client.refresh()
+    dc_result = ducklake_client.read_table("test_schema_refresh", "refresh_table")
+    
+    duckdb_result = conn.execute("SELECT * FROM test_schema_refresh.refresh_table ORDER BY id").fetch_arrow_table()
+    dc_result_sorted = dc_result.sort_by([("id", "ascending")])
+    assert dc_result_sorted.equals(duckdb_result), "Refreshed reads should see the latest snapshot"
+
+
+def test_custom_poolclass(duckdb_conn, postgres_connection_str, data_directory, catalog_database_name):
+    """Test that engine_kwargs can swap the connection pool class."""
+    conn = duckdb_conn
+    
+    conn.execute("CREATE SCHEMA test_schema_pool")
+    conn.execute("CREATE TABLE test_schema_pool.pool_table (id INTEGER)")
+    conn.execute("INSERT INTO test_schema_pool.pool_table VALUES (1), (2)")
+    
+    with DucklakeClient(
+        connection_string=f"{postgres_connection_str}/{catalog_database_name}",
+        data_path=data_directory,
+        engine_kwargs={"poolclass": NullPool}
+    ) as dc:
+        assert isinstance(dc.engine.pool, NullPool)
+        dc_result = dc.read_table("test_schema_pool", "pool_table")
+    
+    assert dc_result.num_rows == 2, "Should have 2 rows"
+
+
+def test_lru_cache_is_bounded():
+    """Test that the client's metadata caches evict their least recently used entries."""
+    cache = _LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    
+    assert len(cache) == 2, "Cache should not grow past its maximum size"
+    assert "b" not in cache, "Least recently used entry should be evicted"
+    assert cache.get("a") == 1 and cache.get("c") == 3